@@ -10,21 +10,29 @@ If you have any questions in mind you can connect to me directly via info@smart-
 import argparse
 import asyncio
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from src.config import logger
 from src.database.db import init_db
 from src.scraper.dyrt_scraper import DyrtScraper
-from src.utils.scheduler import setup_scheduler
+from src.utils.scheduler import run_scheduler
 
 
-async def async_main():
-    """Async main function for scraper operations"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(description='The Dyrt Web Scraper')
     parser.add_argument('--scrape', action='store_true', help='Run scraper immediately')
     parser.add_argument('--schedule', action='store_true', help='Setup scheduled scraping')
     parser.add_argument('--api', action='store_true', help='Start API server')
     parser.add_argument('--test', action='store_true', help='Run API test')
-    args = parser.parse_args()
+    return parser
+
 
+async def async_main(args: argparse.Namespace):
+    """Async main function for scraper operations"""
     # Initialize the database
     logger.info("Initializing database...")
     await init_db()
@@ -39,29 +47,24 @@ async def async_main():
     if args.scrape:
         # Run scraper once
         logger.info("Starting scraper...")
-        scraper = DyrtScraper()
-        await scraper.run()
+        async with DyrtScraper() as scraper:
+            await scraper.run()
         
     if args.schedule:
-        # Setup scheduled scraping
+        # Setup scheduled scraping, runs until interrupted
         logger.info("Setting up scheduler...")
-        setup_scheduler()
+        await run_scheduler()
         
     # If no arguments provided, run scraper once
     if not any(vars(args).values()):
         logger.info("No arguments provided. Running scraper once...")
-        scraper = DyrtScraper()
-        await scraper.run()
+        async with DyrtScraper() as scraper:
+            await scraper.run()
 
 
 def main():
     """Main function - handles API vs async operations"""
-    parser = argparse.ArgumentParser(description='The Dyrt Web Scraper')
-    parser.add_argument('--scrape', action='store_true', help='Run scraper immediately')
-    parser.add_argument('--schedule', action='store_true', help='Setup scheduled scraping')
-    parser.add_argument('--api', action='store_true', help='Start API server')
-    parser.add_argument('--test', action='store_true', help='Run API test')
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
     
     if args.api:
         # Start API server synchronously
@@ -69,8 +72,10 @@ def main():
         from src.api.endpoints import start_api
         start_api()
     else:
-        # Run async operations
-        asyncio.run(async_main())
+        # Run async operations (on uvloop when available)
+        loop_factory = uvloop.new_event_loop if uvloop else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(async_main(args))
 
 
 if __name__ == "__main__":
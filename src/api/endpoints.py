@@ -3,20 +3,46 @@
 FastAPI endpoints for The Dyrt scraper
 """
 import os
+import importlib.util
+from contextlib import asynccontextmanager
+from datetime import datetime
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 import uvicorn
 
-from src.config import logger
-from src.database.db import get_campgrounds_from_db, get_campground_by_id
+from src.config import CAMPGROUND_CACHE_TTL, logger
+from src.database.db import (
+    get_campgrounds_page, get_campground_by_id, get_scraper_logs, stream_campgrounds_json, warm_up_pool
+)
 from src.models.campground import Campground
 
+# uvloop is not available on Windows, fall back to the default asyncio loop there
+API_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+API_HTTP = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open each worker's DB connections before it starts serving requests
+    """
+    try:
+        await warm_up_pool()
+    except Exception as e:
+        # Requests open connections on demand, a failed warm-up must not stop the worker
+        logger.warning(f"Could not warm up the database pool: {e}")
+    yield
+
+
 # Initialize FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="The Dyrt Scraper API",
     description="API for accessing scraped campground data",
-    version="1.0.0"
+    version="1.0.0",
+    # FastAPI runs jsonable_encoder before render(), so orjson only does the byte encoding
+    default_response_class=ORJSONResponse
 )
 
 @app.get("/")
@@ -24,28 +50,48 @@ async def root():
     """Root endpoint"""
     return {"message": "The Dyrt Scraper API", "version": "1.0.0"}
 
-@app.get("/campgrounds", response_model=List[Campground])
+@app.get("/campgrounds", response_model=List[Campground], response_model_exclude_unset=True)
 async def get_campgrounds(
-    limit: int = Query(default=100, le=1000, description="Maximum number of campgrounds to return"),
-    offset: int = Query(default=0, ge=0, description="Number of campgrounds to skip"),
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum number of campgrounds to return"),
+    cursor: Optional[str] = Query(default=None, description="Id of the last campground of the previous page"),
     state: Optional[str] = Query(default=None, description="Filter by state/administrative area"),
-    min_rating: Optional[float] = Query(default=None, ge=0, le=5, description="Minimum rating filter")
+    min_rating: Optional[float] = Query(default=None, ge=0, le=5, description="Minimum rating filter"),
+    if_none_match: Optional[str] = Header(default=None)
 ):
     """
     Get campgrounds with optional filtering
+
+    The cursor for the next page is returned in the `X-Next-Cursor` header.
+    Responses carry an ETag and are answered with 304 when it still matches.
     """
     try:
-        campgrounds = await get_campgrounds_from_db(
+        campgrounds, etag = await get_campgrounds_page(
             limit=limit, 
-            offset=offset, 
+            last_id=cursor, 
             state=state, 
             min_rating=min_rating
         )
+        headers = {"ETag": etag, "Cache-Control": f"public, max-age={CAMPGROUND_CACHE_TTL}"}
+        if len(campgrounds) == limit:
+            headers["X-Next-Cursor"] = campgrounds[-1]["id"]
+        
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+        
+        response.headers.update(headers)
         return campgrounds
     except Exception as e:
         logger.error(f"Error fetching campgrounds: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.get("/campgrounds/export")
+async def export_campgrounds():
+    """
+    Stream all campgrounds as newline-delimited JSON
+    """
+    return StreamingResponse(stream_campgrounds_json(), media_type="application/x-ndjson")
+
 @app.get("/campgrounds/{campground_id}", response_model=Campground)
 async def get_campground(campground_id: str):
     """
@@ -62,6 +108,35 @@ async def get_campground(campground_id: str):
         logger.error(f"Error fetching campground {campground_id}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.get("/logs")
+async def get_logs(
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of logs to return"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page")
+):
+    """
+    Get scraper run logs, newest first
+
+    The cursor is `<start_time>_<id>` of the last log of the previous page,
+    so logs sharing a start_time are not skipped at page boundaries.
+    """
+    before = None
+    if cursor is not None:
+        try:
+            start_time, log_id = cursor.rsplit("_", 1)
+            before = (datetime.fromisoformat(start_time), int(log_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    try:
+        logs = await get_scraper_logs(limit=limit, before=before)
+        next_cursor = None
+        if len(logs) == limit:
+            next_cursor = f"{logs[-1]['start_time'].isoformat()}_{logs[-1]['id']}"
+        return {"logs": logs, "next_cursor": next_cursor}
+    except Exception as e:
+        logger.error(f"Error fetching scraper logs: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @app.get("/health")
 async def health_check():
     """
@@ -76,15 +151,23 @@ def start_api():
     # Environment variables
     API_HOST = os.getenv("API_HOST", "0.0.0.0")
     API_PORT = int(os.getenv("API_PORT", "8000"))
+    # Each worker has its own DB pool of up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections,
+    # so the default stays fixed and small rather than following the CPU count
+    API_WORKERS = int(os.getenv("API_WORKERS", "2"))
     
-    logger.info(f"Starting API server at {API_HOST}:{API_PORT}")
+    logger.info(f"Starting API server at {API_HOST}:{API_PORT} with {API_WORKERS} workers")
     
     # DÜZELTME: asyncio.run kullanmak yerine direkt uvicorn.run
+    # The import string form is required for multiple workers. The scheduler
+    # is not started here, run it in a single dedicated process with --schedule.
     uvicorn.run(
         "src.api.endpoints:app",  # Module path to app
         host=API_HOST, 
         port=API_PORT,
+        workers=API_WORKERS,
         reload=False,  # Production'da False olmalı
+        loop=API_LOOP,
+        http=API_HTTP,
         log_level="info"
     )
 
@@ -104,6 +187,7 @@ async def start_api_async():
         app=app,
         host=API_HOST,
         port=API_PORT,
+        loop=API_LOOP,
         log_level="info"
     )
     
@@ -3,27 +3,82 @@
 Database connection and operations
 """
 import asyncio
+import hashlib
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from typing import AsyncIterator, List, Optional, Dict, Any, Mapping, Set, Tuple, Union
 
-from sqlalchemy import create_engine, select, update, exists
+import orjson
+from async_lru import alru_cache
+
+from sqlalchemy import create_engine, inspect, select, update, delete, insert, exists, func, any_, bindparam, text, tuple_, String
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, selectinload
 
-from src.config import DB_URL, logger
-from src.database.models import Base, Campground, CamperType, AccommodationType, PhotoUrl, ScraperLog
+from src.config import (
+    DB_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_STATEMENT_CACHE_SIZE, SAVE_BATCH_SIZE, CAMPGROUND_CACHE_TTL, logger
+)
+from src.database.models import (
+    Base, Campground, CamperType, AccommodationType, PhotoUrl, ScraperLog,
+    campground_camper_types, campground_accommodation_types
+)
 from src.models.campground import Campground as CampgroundModel
 
 
 # Create async engine
+#
+# Bulk write settings for asyncpg:
+# - executemany (session.execute(stmt, rows)) goes through asyncpg's
+#   native executemany, which pipelines one prepared statement over all rows.
+#   executemany_mode / execute_values only apply to psycopg2.
+# - statement_cache_size is asyncpg's per-connection prepared statement cache,
+#   prepared_statement_cache_size is SQLAlchemy's cache of asyncpg statement
+#   objects; array-bound IN lists (see in_array) keep the SQL text stable so both hit.
 async_engine = create_async_engine(
     DB_URL.replace('postgresql://', 'postgresql+asyncpg://'),
     echo=False,
-    future=True
+    future=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,
+    connect_args={
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE // 2,
+    }
 )
 async_session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
 
+# name -> id caches for the small, rarely changing type tables
+_camper_type_cache: Dict[str, int] = {}
+_acc_type_cache: Dict[str, int] = {}
+
+
+def _create_missing_indexes(sync_conn):
+    """
+    Create indexes added to the models after their tables already existed
+
+    create_all() skips existing tables together with their indexes.
+    """
+    existing_photo_indexes = {index["name"] for index in inspect(sync_conn).get_indexes(PhotoUrl.__tablename__)}
+    if "uq_photo_campground_url" not in existing_photo_indexes:
+        # Tables from before the unique index may repeat a URL per campground; keep the oldest row
+        result = sync_conn.execute(text(
+            "DELETE FROM photo_urls a USING photo_urls b "
+            "WHERE a.campground_id = b.campground_id AND a.url = b.url AND a.id > b.id"
+        ))
+        if result.rowcount:
+            logger.warning("Removed {} duplicate photo URLs before adding uq_photo_campground_url", result.rowcount)
+    
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
 
 async def init_db():
     """
@@ -33,193 +88,432 @@ async def init_db():
         # Create tables
         async with async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_create_missing_indexes)
             
         logger.success("Database initialized successfully")
         return True
     except Exception as e:
-        logger.error(f"Error initializing database: {e}")
+        logger.error("Error initializing database: {}", e)
         raise
 
 
+async def warm_up_pool():
+    """
+    Open `DB_POOL_SIZE` connections concurrently so the first requests don't pay the handshake cost
+
+    Called from the API's lifespan hook, once per worker process.
+    """
+    async def _ping():
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(DB_POOL_SIZE)))
+
+
+# Tables whose non-unique secondary indexes are rebuilt after a bulk load
+_BULK_LOAD_TABLES = (
+    Campground.__table__, PhotoUrl.__table__,
+    campground_camper_types, campground_accommodation_types,
+)
+
+
+@asynccontextmanager
+async def bulk_load_mode(session: AsyncSession, tables=_BULK_LOAD_TABLES) -> AsyncIterator[AsyncSession]:
+    """
+    Drop the non-unique secondary indexes of `tables` for the duration of a bulk load and rebuild them afterwards
+
+    Building an index once over the loaded rows is much cheaper than maintaining it row by row.
+    Everything runs in the session's transaction, so a failed load leaves the indexes intact.
+    """
+    indexes = [index for table in tables for index in table.indexes if not index.unique]
+    for index in indexes:
+        await session.execute(text(f'DROP INDEX IF EXISTS "{index.name}"'))
+    yield session
+    conn = await session.connection()
+    for index in indexes:
+        await conn.run_sync(index.create)
+
+
+@asynccontextmanager
+async def _session() -> AsyncIterator[AsyncSession]:
+    """
+    Open a session with a transaction that commits on success and rolls back on error
+    """
+    async with async_session_factory() as session:
+        async with session.begin():
+            yield session
+
+
 async def get_db_session() -> AsyncSession:
     """
     Get a database session
     """
-    session = async_session_factory()
-    try:
+    async with async_session_factory() as session:
         yield session
-    finally:
-        await session.close()
+
+
+def in_array(column, values, item_type=String):
+    """
+    `column = ANY(:values)` with `values` bound as a single array parameter
+
+    Unlike IN (...), the SQL text does not depend on len(values), so asyncpg
+    can reuse its cached prepared statement.
+    """
+    return column == any_(bindparam(None, list(values), type_=ARRAY(item_type)))
+
+
+def _campground_row(camp_model: CampgroundModel) -> Dict[str, Any]:
+    """
+    Convert a campground Pydantic model into a `campgrounds` table row
+    """
+    return {
+        "id": camp_model.id,
+        "type": camp_model.type,
+        "links_self": camp_model.links.get("self", ""),
+        "name": camp_model.name,
+        "latitude": camp_model.latitude,
+        "longitude": camp_model.longitude,
+        "region_name": camp_model.region_name,
+        "administrative_area": camp_model.administrative_area,
+        "nearest_city_name": camp_model.nearest_city_name,
+        "bookable": camp_model.bookable,
+        "operator": camp_model.operator,
+        "photo_url": camp_model.photo_url or None,
+        "photos_count": camp_model.photos_count,
+        "rating": camp_model.rating,
+        "reviews_count": camp_model.reviews_count,
+        "slug": camp_model.slug,
+        "price_low": camp_model.price_low,
+        "price_high": camp_model.price_high,
+        "availability_updated_at": camp_model.availability_updated_at,
+        "address": camp_model.address,
+    }
+
+
+async def _resolve_type_ids(session: AsyncSession, model, names: Set[str], cache: Dict[str, int]) -> Dict[str, int]:
+    """
+    Return a name -> id mapping for `names`, inserting the missing type names
+
+    Names already in `cache` cost no round-trip. The caller is responsible for
+    adding the result to `cache` once the transaction has been committed.
+    """
+    type_ids = {name: cache[name] for name in names if name in cache}
+    missing = sorted(names - type_ids.keys())
+    if not missing:
+        return type_ids
+
+    def _lookup(pending):
+        return select(model.id, model.name).where(in_array(model.name, pending))
+
+    result = await session.execute(_lookup(missing))
+    type_ids.update({name: type_id for type_id, name in result.all()})
+    missing = [name for name in missing if name not in type_ids]
+    if not missing:
+        return type_ids
+
+    result = await session.execute(
+        pg_insert(model.__table__)
+        .values([{"name": name} for name in missing])
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(model.id, model.name)
+    )
+    type_ids.update({name: type_id for type_id, name in result.all()})
+
+    # Names inserted by a concurrent writer are not returned by DO NOTHING
+    missing = [name for name in missing if name not in type_ids]
+    if missing:
+        result = await session.execute(_lookup(missing))
+        type_ids.update({name: type_id for type_id, name in result.all()})
+
+    return type_ids
+
+
+async def _replace_associations(session: AsyncSession, table, camp_ids: List[str], pairs: List[Dict[str, Any]]):
+    """
+    Replace the association rows of the given campgrounds with `pairs`
+    """
+    await session.execute(delete(table).where(in_array(table.c.campground_id, camp_ids)))
+    if pairs:
+        await session.execute(insert(table), pairs)
+
+
+async def _copy_records(session: AsyncSession, table_name: str, columns: List[str], records: List[tuple]):
+    """
+    Stream rows over the asyncpg binary COPY protocol
+
+    Uses the session's own connection, so the rows are part of its transaction.
+    COPY bypasses column defaults, every NOT NULL / timestamp column must be given.
+    """
+    if not records:
+        return
+
+    conn = await session.connection()
+    raw_conn = await conn.get_raw_connection()
+    await raw_conn.driver_connection.copy_records_to_table(table_name, records=records, columns=columns)
+
+
+async def _copy_photo_urls(session: AsyncSession, records: List[tuple]):
+    """
+    COPY (campground_id, url, created_at) photo URL rows
+    """
+    await _copy_records(session, PhotoUrl.__tablename__, ["campground_id", "url", "created_at"], records)
+
+
+async def bulk_copy_campgrounds(session: AsyncSession, rows: List[Dict[str, Any]]):
+    """
+    Load new campground rows with COPY, much faster than INSERT for large loads
+
+    Rows must not exist yet, COPY has no ON CONFLICT handling.
+    """
+    if not rows:
+        return
+
+    now = datetime.utcnow()
+    columns = list(rows[0])
+    records = [tuple(row[column] for column in columns) + (now, now) for row in rows]
+    await _copy_records(session, Campground.__tablename__, columns + ["created_at", "updated_at"], records)
+
+
+async def _save_chunk(models_by_id: Dict[str, CampgroundModel]) -> Dict[str, int]:
+    """
+    Upsert one chunk of campgrounds in its own session and transaction
+    """
+    camp_ids = list(models_by_id)
+    
+    async with _session() as session:
+        # Count existing rows once instead of a SELECT per campground
+        result = await session.execute(select(Campground.id).where(in_array(Campground.id, camp_ids)))
+        updated_count = len(result.scalars().all())
+        added_count = len(camp_ids) - updated_count
+        
+        # Upsert all campgrounds in a single statement
+        camp_rows = [_campground_row(m) for m in models_by_id.values()]
+        stmt = pg_insert(Campground.__table__)
+        update_columns = {
+            column: stmt.excluded[column]
+            for column in camp_rows[0]
+            if column not in ("id", "type", "links_self")
+        }
+        # A run without geocoding must not erase the addresses an earlier run stored
+        update_columns["address"] = func.coalesce(stmt.excluded.address, Campground.__table__.c.address)
+        update_columns["updated_at"] = func.now()
+        await session.execute(stmt.on_conflict_do_update(index_elements=["id"], set_=update_columns), camp_rows)
+        
+        # Resolve camper / accommodation type ids for the whole chunk
+        camper_type_ids = await _resolve_type_ids(
+            session, CamperType,
+            {name for m in models_by_id.values() for name in m.camper_types},
+            _camper_type_cache
+        )
+        acc_type_ids = await _resolve_type_ids(
+            session, AccommodationType,
+            {name for m in models_by_id.values() for name in m.accommodation_type_names},
+            _acc_type_cache
+        )
+        
+        await _replace_associations(
+            session, campground_camper_types, camp_ids,
+            [
+                {"campground_id": m.id, "camper_type_id": type_id}
+                for m in models_by_id.values()
+                for type_id in sorted({camper_type_ids[name] for name in m.camper_types})
+            ]
+        )
+        await _replace_associations(
+            session, campground_accommodation_types, camp_ids,
+            [
+                {"campground_id": m.id, "accommodation_type_id": type_id}
+                for m in models_by_id.values()
+                for type_id in sorted({acc_type_ids[name] for name in m.accommodation_type_names})
+            ]
+        )
+        
+        # Replace photo URLs, in (campground_id, url) order like the unique index
+        await session.execute(delete(PhotoUrl).where(in_array(PhotoUrl.campground_id, camp_ids)))
+        now = datetime.utcnow()
+        await _copy_photo_urls(session, [
+            (m.id, url, now)
+            for m in models_by_id.values() for url in sorted(set(m.photo_urls))
+        ])
+    
+    # Only committed ids may be shared with other chunks
+    _camper_type_cache.update(camper_type_ids)
+    _acc_type_cache.update(acc_type_ids)
+    
+    return {"added": added_count, "updated": updated_count}
+
+
+async def write_scraper_log(**values) -> None:
+    """
+    Record a finished scraper run with a single INSERT
+    """
+    async with _session() as session:
+        await session.execute(insert(ScraperLog).values(**values))
 
 
 async def save_campgrounds(campgrounds: List[CampgroundModel]) -> Dict[str, int]:
     """
     Save campgrounds to the database
+
+    Campgrounds are split into chunks of `SAVE_BATCH_SIZE`, each saved
+    concurrently in its own transaction. A run saves several batches, so
+    recording it in `scraper_logs` is left to the caller (write_scraper_log).
     """
-    session = async_session_factory()
     added_count = 0
     updated_count = 0
-    scraper_log = None
+    errors = []
     
     try:
-        # Start a scraper log
-        scraper_log = ScraperLog(
-            start_time=datetime.utcnow(),
-            status="running",
-            records_processed=len(campgrounds)
-        )
-        session.add(scraper_log)
-        await session.commit()
-        await session.refresh(scraper_log)  # Refresh to get the ID
+        # Last occurrence wins, ON CONFLICT cannot touch the same row twice in one statement.
+        # Sorted by id so every chunk writes a contiguous key range of the primary key index
+        models = sorted({camp_model.id: camp_model for camp_model in campgrounds}.items())
+        chunks = [dict(models[i:i + SAVE_BATCH_SIZE]) for i in range(0, len(models), SAVE_BATCH_SIZE)]
         
-        for camp_model in campgrounds:
-            # Check if campground already exists
-            stmt = select(Campground).where(Campground.id == camp_model.id)
-            result = await session.execute(stmt)
-            existing_camp = result.scalars().first()
-            
-            if existing_camp:
-                # Update existing campground
-                existing_camp.name = camp_model.name
-                existing_camp.latitude = camp_model.latitude
-                existing_camp.longitude = camp_model.longitude
-                existing_camp.region_name = camp_model.region_name
-                existing_camp.administrative_area = camp_model.administrative_area
-                existing_camp.nearest_city_name = camp_model.nearest_city_name
-                existing_camp.bookable = camp_model.bookable
-                existing_camp.operator = camp_model.operator
-                existing_camp.photo_url = str(camp_model.photo_url) if camp_model.photo_url else None
-                existing_camp.photos_count = camp_model.photos_count
-                existing_camp.rating = camp_model.rating
-                existing_camp.reviews_count = camp_model.reviews_count
-                existing_camp.slug = camp_model.slug
-                existing_camp.price_low = camp_model.price_low
-                existing_camp.price_high = camp_model.price_high
-                existing_camp.availability_updated_at = camp_model.availability_updated_at
-                
-                # Clear existing relationships before updating
-                existing_camp.camper_types = []
-                existing_camp.accommodation_types = []
-                await session.commit()
-                
-                updated_count += 1
-                camp_obj = existing_camp
-            else:
-                # Create new campground
-                new_camp = Campground(
-                    id=camp_model.id,
-                    type=camp_model.type,
-                    links_self=str(camp_model.links.get("self", "")),
-                    name=camp_model.name,
-                    latitude=camp_model.latitude,
-                    longitude=camp_model.longitude,
-                    region_name=camp_model.region_name,
-                    administrative_area=camp_model.administrative_area,
-                    nearest_city_name=camp_model.nearest_city_name,
-                    bookable=camp_model.bookable,
-                    operator=camp_model.operator,
-                    photo_url=str(camp_model.photo_url) if camp_model.photo_url else None,
-                    photos_count=camp_model.photos_count,
-                    rating=camp_model.rating,
-                    reviews_count=camp_model.reviews_count,
-                    slug=camp_model.slug,
-                    price_low=camp_model.price_low,
-                    price_high=camp_model.price_high,
-                    availability_updated_at=camp_model.availability_updated_at,
-                )
-                session.add(new_camp)
-                await session.commit()
-                await session.refresh(new_camp)  # Refresh to get the ID
-                
-                added_count += 1
-                camp_obj = new_camp
-            
-            # Process camper types
-            for camper_type_name in camp_model.camper_types:
-                # Check if camper type exists
-                stmt = select(CamperType).where(CamperType.name == camper_type_name)
-                result = await session.execute(stmt)
-                camper_type = result.scalars().first()
-                
-                if not camper_type:
-                    camper_type = CamperType(name=camper_type_name)
-                    session.add(camper_type)
-                    await session.commit()
-                    await session.refresh(camper_type)  # Refresh to get the ID
-                
-                # Add camper type to campground
-                camp_obj.camper_types.append(camper_type)
-            
-            # Process accommodation types
-            for acc_type_name in camp_model.accommodation_type_names:
-                # Check if accommodation type exists
-                stmt = select(AccommodationType).where(AccommodationType.name == acc_type_name)
-                result = await session.execute(stmt)
-                acc_type = result.scalars().first()
-                
-                if not acc_type:
-                    acc_type = AccommodationType(name=acc_type_name)
-                    session.add(acc_type)
-                    await session.commit()
-                    await session.refresh(acc_type)  # Refresh to get the ID
-                
-                # Add accommodation type to campground
-                camp_obj.accommodation_types.append(acc_type)
-            
-            # Process photo URLs - Clear existing ones first
-            # Delete existing photo URLs
-            if camp_obj.photo_urls:
-                for photo in camp_obj.photo_urls:
-                    await session.delete(photo)
-                await session.commit()
-                
-            # Add new photo URLs
-            for photo_url in camp_model.photo_urls:
-                photo = PhotoUrl(
-                    campground_id=camp_obj.id,
-                    url=str(photo_url)
-                )
-                session.add(photo)
-            
-            await session.commit()
+        # Leave a couple of pool connections free for other work
+        semaphore = asyncio.Semaphore(max(1, DB_POOL_SIZE - 2))
+        
+        async def _save_limited(chunk):
+            async with semaphore:
+                return await _save_chunk(chunk)
         
-        # Update scraper log
-        if scraper_log:
-            scraper_log.end_time = datetime.utcnow()
-            scraper_log.status = "success"
-            scraper_log.records_added = added_count
-            scraper_log.records_updated = updated_count
-            await session.commit()
+        results = await asyncio.gather(*(_save_limited(chunk) for chunk in chunks), return_exceptions=True)
         
-        return {"added": added_count, "updated": updated_count}
+        for result in results:
+            if isinstance(result, Exception):
+                errors.append(result)
+                continue
+            added_count += result["added"]
+            updated_count += result["updated"]
     except Exception as e:
-        logger.error(f"Error saving campgrounds: {e}")
-        # Update scraper log if it exists
-        if scraper_log:
-            scraper_log.end_time = datetime.utcnow()
-            scraper_log.status = "failed"
-            scraper_log.errors = {"message": str(e)}
-            await session.commit()
+        errors.append(e)
+    
+    if errors:
+        logger.error("Error saving campgrounds: {} ({} failed batches)", errors[0], len(errors))
+        raise errors[0]
+    
+    return {"added": added_count, "updated": updated_count}
+
+
+# Columns returned by the campground listing, selected through Core to skip ORM hydration
+CAMPGROUND_LIST_COLUMNS = (
+    Campground.id,
+    Campground.type,
+    Campground.name,
+    Campground.latitude,
+    Campground.longitude,
+    Campground.region_name,
+    Campground.administrative_area,
+    Campground.nearest_city_name,
+    Campground.bookable,
+    Campground.operator,
+    Campground.rating,
+    Campground.reviews_count,
+    Campground.price_low,
+    Campground.price_high,
+    Campground.updated_at,
+)
+
+
+async def get_all_campgrounds(
+    limit: int = 100,
+    last_id: Optional[str] = None,
+    state: Optional[str] = None,
+    min_rating: Optional[float] = None
+) -> List[Mapping[str, Any]]:
+    """
+    Get a page of campgrounds from the database
+
+    Uses keyset pagination on the primary key: pass the last `id` of the
+    previous page as `last_id` to get the next one.
+    """
+    try:
+        async with _session() as session:
+            stmt = select(*CAMPGROUND_LIST_COLUMNS).order_by(Campground.id).limit(limit)
+            if last_id is not None:
+                stmt = stmt.where(Campground.id > last_id)
+            if state is not None:
+                stmt = stmt.where(Campground.administrative_area == state)
+            if min_rating is not None:
+                stmt = stmt.where(Campground.rating >= min_rating)
+        
+            result = await session.execute(stmt)
+            return result.mappings().all()
+    except Exception as e:
+        logger.error("Error getting campgrounds: {}", e)
         raise
-    finally:
-        await session.close()
 
 
-async def get_all_campgrounds() -> List[Dict[str, Any]]:
+@alru_cache(maxsize=256, ttl=CAMPGROUND_CACHE_TTL)
+async def get_campgrounds_page(
+    limit: int = 100,
+    last_id: Optional[str] = None,
+    state: Optional[str] = None,
+    min_rating: Optional[float] = None
+) -> Tuple[List[Mapping[str, Any]], str]:
+    """
+    Get a page of campgrounds together with its ETag, cached for `CAMPGROUND_CACHE_TTL` seconds
+
+    The cache lives in each API worker while the scraper saves from another
+    process, so pages are only refreshed when the TTL expires: new data can
+    take up to `CAMPGROUND_CACHE_TTL` seconds to appear.
+    """
+    campgrounds = await get_all_campgrounds(limit=limit, last_id=last_id, state=state, min_rating=min_rating)
+    digest = hashlib.sha256(orjson.dumps(campgrounds, default=dict)).hexdigest()
+    return campgrounds, f'W/"{digest}"'
+
+
+async def stream_campgrounds_json(batch_size: int = 1000) -> AsyncIterator[bytes]:
     """
-    Get all campgrounds from the database
+    Yield all campgrounds as newline-delimited JSON, `batch_size` lines per chunk
+
+    PostgreSQL builds the JSON with row_to_json and rows are read through an
+    asyncpg server-side cursor, so memory use is bounded by `batch_size`
+    whatever the table size.
+    """
+    async with async_engine.connect() as conn:
+        raw_conn = await conn.get_raw_connection()
+        driver_conn = raw_conn.driver_connection
+        # asyncpg cursors only work inside a transaction
+        async with driver_conn.transaction():
+            cursor = await driver_conn.cursor("SELECT row_to_json(c)::text FROM campgrounds c ORDER BY c.id")
+            while True:
+                records = await cursor.fetch(batch_size)
+                if not records:
+                    break
+                yield ("\n".join(record[0] for record in records) + "\n").encode()
+
+
+async def get_campground_by_id(camp_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a campground by ID
     """
-    session = async_session_factory()
     try:
-        stmt = select(Campground)
-        result = await session.execute(stmt)
-        campgrounds = result.scalars().all()
+        async with _session() as session:
+            stmt = (
+                select(Campground)
+                .where(Campground.id == camp_id)
+                .options(
+                    selectinload(Campground.camper_types),
+                    selectinload(Campground.accommodation_types),
+                    selectinload(Campground.photo_urls)
+                )
+            )
+            result = await session.execute(stmt)
+            camp = result.scalars().first()
+        
+            if not camp:
+                return None
+        
+            # Get related data
+            camper_types = [ct.name for ct in camp.camper_types]
+            accommodation_types = [at.name for at in camp.accommodation_types]
+            photo_urls = [pu.url for pu in camp.photo_urls]
         
-        # Convert to dict
-        campgrounds_list = []
-        for camp in campgrounds:
-            campgrounds_list.append({
+            # Convert to dict
+            camp_dict = {
                 "id": camp.id,
+                "type": camp.type,
+                "links_self": camp.links_self,
                 "name": camp.name,
                 "latitude": camp.latitude,
                 "longitude": camp.longitude,
@@ -228,103 +522,63 @@ async def get_all_campgrounds() -> List[Dict[str, Any]]:
                 "nearest_city_name": camp.nearest_city_name,
                 "bookable": camp.bookable,
                 "operator": camp.operator,
+                "photo_url": camp.photo_url,
+                "photos_count": camp.photos_count,
                 "rating": camp.rating,
                 "reviews_count": camp.reviews_count,
+                "slug": camp.slug,
                 "price_low": camp.price_low,
                 "price_high": camp.price_high,
-                "updated_at": camp.updated_at.isoformat() if camp.updated_at else None,
-            })
+                "availability_updated_at": camp.availability_updated_at,
+                "address": camp.address,
+                "camper_types": camper_types,
+                "accommodation_types": accommodation_types,
+                "photo_urls": photo_urls,
+                "created_at": camp.created_at,
+                "updated_at": camp.updated_at,
+            }
         
-        return campgrounds_list
+            return camp_dict
     except Exception as e:
-        logger.error(f"Error getting campgrounds: {e}")
+        logger.error("Error getting campground by ID: {}", e)
         raise
-    finally:
-        await session.close()
 
 
-async def get_campground_by_id(camp_id: str) -> Optional[Dict[str, Any]]:
+async def get_scraper_logs(limit: int = 50, before: Optional[Tuple[datetime, int]] = None) -> List[Dict[str, Any]]:
     """
-    Get a campground by ID
-    """
-    session = async_session_factory()
-    try:
-        stmt = select(Campground).where(Campground.id == camp_id)
-        result = await session.execute(stmt)
-        camp = result.scalars().first()
-        
-        if not camp:
-            return None
-        
-        # Get related data
-        camper_types = [ct.name for ct in camp.camper_types]
-        accommodation_types = [at.name for at in camp.accommodation_types]
-        photo_urls = [pu.url for pu in camp.photo_urls]
-        
-        # Convert to dict
-        camp_dict = {
-            "id": camp.id,
-            "type": camp.type,
-            "links_self": camp.links_self,
-            "name": camp.name,
-            "latitude": camp.latitude,
-            "longitude": camp.longitude,
-            "region_name": camp.region_name,
-            "administrative_area": camp.administrative_area,
-            "nearest_city_name": camp.nearest_city_name,
-            "bookable": camp.bookable,
-            "operator": camp.operator,
-            "photo_url": camp.photo_url,
-            "photos_count": camp.photos_count,
-            "rating": camp.rating,
-            "reviews_count": camp.reviews_count,
-            "slug": camp.slug,
-            "price_low": camp.price_low,
-            "price_high": camp.price_high,
-            "availability_updated_at": camp.availability_updated_at.isoformat() if camp.availability_updated_at else None,
-            "address": camp.address,
-            "camper_types": camper_types,
-            "accommodation_types": accommodation_types,
-            "photo_urls": photo_urls,
-            "created_at": camp.created_at.isoformat(),
-            "updated_at": camp.updated_at.isoformat(),
-        }
-        
-        return camp_dict
-    except Exception as e:
-        logger.error(f"Error getting campground by ID: {e}")
-        raise
-    finally:
-        await session.close()
-
+    Get the most recent scraper logs
 
-async def get_scraper_logs() -> List[Dict[str, Any]]:
+    Pass the `(start_time, id)` of the last log of the previous page as
+    `before` to get the next, older page. The id breaks ties between logs
+    with the same start_time.
     """
-    Get all scraper logs
-    """
-    session = async_session_factory()
     try:
-        stmt = select(ScraperLog).order_by(ScraperLog.start_time.desc())
-        result = await session.execute(stmt)
-        logs = result.scalars().all()
+        async with _session() as session:
+            stmt = (
+                select(ScraperLog)
+                .order_by(ScraperLog.start_time.desc(), ScraperLog.id.desc())
+                .limit(limit)
+            )
+            if before is not None:
+                stmt = stmt.where(tuple_(ScraperLog.start_time, ScraperLog.id) < tuple_(*before))
+            result = await session.execute(stmt)
+            logs = result.scalars().all()
         
-        # Convert to dict
-        logs_list = []
-        for log in logs:
-            logs_list.append({
-                "id": log.id,
-                "start_time": log.start_time.isoformat(),
-                "end_time": log.end_time.isoformat() if log.end_time else None,
-                "status": log.status,
-                "records_processed": log.records_processed,
-                "records_added": log.records_added,
-                "records_updated": log.records_updated,
-                "errors": log.errors,
-            })
+            # Convert to dict
+            logs_list = []
+            for log in logs:
+                logs_list.append({
+                    "id": log.id,
+                    "start_time": log.start_time,
+                    "end_time": log.end_time,
+                    "status": log.status,
+                    "records_processed": log.records_processed,
+                    "records_added": log.records_added,
+                    "records_updated": log.records_updated,
+                    "errors": log.errors,
+                })
         
-        return logs_list
+            return logs_list
     except Exception as e:
-        logger.error(f"Error getting scraper logs: {e}")
+        logger.error("Error getting scraper logs: {}", e)
         raise
-    finally:
-        await session.close()
\ No newline at end of file
@@ -5,7 +5,9 @@ Database models for the campground scraper.
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
-from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, ForeignKey, Table, JSON
+from sqlalchemy import (
+    Column, String, Float, Numeric, Integer, Boolean, DateTime, ForeignKey, Table, JSON, Index, text
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, Mapped
 from sqlalchemy.sql import func
@@ -16,16 +18,20 @@ Base = declarative_base()
 campground_camper_types = Table(
     'campground_camper_types',
     Base.metadata,
-    Column('campground_id', String, ForeignKey('campgrounds.id', ondelete='CASCADE'), primary_key=True),
-    Column('camper_type_id', Integer, ForeignKey('camper_types.id', ondelete='CASCADE'), primary_key=True)
+    Column('campground_id', String(64), ForeignKey('campgrounds.id', ondelete='CASCADE', deferrable=True), primary_key=True),
+    Column('camper_type_id', Integer, ForeignKey('camper_types.id', ondelete='CASCADE', deferrable=True), primary_key=True),
+    # The primary key only serves lookups by campground_id
+    Index('ix_cct_camper_type_id', 'camper_type_id')
 )
 
 # Association table for campground-accommodation_type many-to-many relationship
 campground_accommodation_types = Table(
     'campground_accommodation_types',
     Base.metadata,
-    Column('campground_id', String, ForeignKey('campgrounds.id', ondelete='CASCADE'), primary_key=True),
-    Column('accommodation_type_id', Integer, ForeignKey('accommodation_types.id', ondelete='CASCADE'), primary_key=True)
+    Column('campground_id', String(64), ForeignKey('campgrounds.id', ondelete='CASCADE', deferrable=True), primary_key=True),
+    Column('accommodation_type_id', Integer, ForeignKey('accommodation_types.id', ondelete='CASCADE', deferrable=True), primary_key=True),
+    # The primary key only serves lookups by campground_id
+    Index('ix_cat_accommodation_type_id', 'accommodation_type_id')
 )
 
 
@@ -35,33 +41,45 @@ class Campground(Base):
     """
     __tablename__ = 'campgrounds'
 
-    id = Column(String, primary_key=True)
-    type = Column(String)
-    links_self = Column(String)
-    name = Column(String, nullable=False)
-    latitude = Column(Float)
-    longitude = Column(Float)
-    region_name = Column(String)
-    administrative_area = Column(String)
-    nearest_city_name = Column(String)
-    bookable = Column(Boolean, default=False)
-    operator = Column(String)
-    photo_url = Column(String)
+    id = Column(String(64), primary_key=True)
+    type = Column(String(32))
+    links_self = Column(String(512))
+    name = Column(String(255), nullable=False)
+    # Exact decimals; asdecimal=False keeps floats on the Python side
+    latitude = Column(Numeric(9, 6, asdecimal=False))
+    longitude = Column(Numeric(9, 6, asdecimal=False))
+    region_name = Column(String(128), index=True)
+    administrative_area = Column(String(128))  # leading column of ix_campgrounds_area_rating
+    nearest_city_name = Column(String(128), index=True)
+    bookable = Column(Boolean, default=False, server_default=text('false'))
+    operator = Column(String(255))
+    photo_url = Column(String(1024))
     photos_count = Column(Integer, default=0)
     rating = Column(Float)
     reviews_count = Column(Integer, default=0)
-    slug = Column(String)
-    price_low = Column(Float)
-    price_high = Column(Float)
+    slug = Column(String(255), index=True)
+    price_low = Column(Numeric(8, 2, asdecimal=False))
+    price_high = Column(Numeric(8, 2, asdecimal=False))
     availability_updated_at = Column(DateTime)
-    address = Column(String)  # Bonus field for geocoding
+    address = Column(String(512))  # Bonus field for geocoding
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
-    # Relationships
-    camper_types = relationship("CamperType", secondary=campground_camper_types, back_populates="campgrounds")
-    accommodation_types = relationship("AccommodationType", secondary=campground_accommodation_types, back_populates="campgrounds")
-    photo_urls = relationship("PhotoUrl", back_populates="campground", cascade="all, delete-orphan")
+    __table_args__ = (
+        # /campgrounds filters by state and minimum rating
+        Index('ix_campgrounds_area_rating', administrative_area, rating.desc(), postgresql_using='btree'),
+        Index('ix_campgrounds_rating_nn', rating, postgresql_where=text('rating IS NOT NULL')),
+        # Bounding box queries
+        Index('ix_campgrounds_latlon', latitude, longitude),
+        # Time-range scans; rows are appended roughly in created_at order, so a tiny BRIN index suffices
+        Index('ix_campgrounds_created_brin', created_at, postgresql_using='brin'),
+    )
+
+    # Relationships - lazy loading is disabled, queries opt in with selectinload()
+    # so a listing can never issue one SELECT per campground
+    camper_types = relationship("CamperType", secondary=campground_camper_types, back_populates="campgrounds", lazy="raise")
+    accommodation_types = relationship("AccommodationType", secondary=campground_accommodation_types, back_populates="campgrounds", lazy="raise")
+    photo_urls = relationship("PhotoUrl", back_populates="campground", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
     def __repr__(self):
         return f"<Campground {self.name}>"
@@ -108,10 +126,16 @@ class PhotoUrl(Base):
     __tablename__ = 'photo_urls'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    campground_id = Column(String, ForeignKey('campgrounds.id', ondelete='CASCADE'))
-    url = Column(String, nullable=False)
+    campground_id = Column(String(64), ForeignKey('campgrounds.id', ondelete='CASCADE', deferrable=True))
+    url = Column(String(1024), nullable=False)
     created_at = Column(DateTime, default=func.now())
 
+    __table_args__ = (
+        # Also serves lookups by campground_id, and ON CONFLICT DO NOTHING inserts.
+        # A unique index rather than a constraint so init_db adds it to existing tables
+        Index('uq_photo_campground_url', 'campground_id', 'url', unique=True),
+    )
+
     # Relationship
     campground = relationship("Campground", back_populates="photo_urls")
 
@@ -6,15 +6,23 @@ import asyncio
 import sys
 import os
 import json
+from contextlib import AsyncExitStack
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.database.db import init_db, async_session_factory
-from src.database.models import Campground, CamperType, AccommodationType, PhotoUrl, ScraperLog
-from src.config import logger
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.database.db import init_db, async_session_factory, bulk_copy_campgrounds, bulk_load_mode, in_array
+from src.database.models import (
+    Campground, CamperType, AccommodationType, PhotoUrl, ScraperLog,
+    campground_camper_types, campground_accommodation_types
+)
+from src.config import BULK_LOAD_INDEX_THRESHOLD, COPY_THRESHOLD, logger
 
 # Example seed data for testing
 SEED_CAMPGROUNDS = [
@@ -73,106 +81,109 @@ SEED_CAMPGROUNDS = [
     }
 ]
 
+# Seed rows are built once at import, in the shape the bulk inserts expect
+# and sorted by primary / unique key for better B-tree insert locality
+_CAMP_COLS = (
+    "id", "type", "links_self", "name", "latitude", "longitude", "region_name",
+    "administrative_area", "nearest_city_name", "bookable", "operator", "photo_url",
+    "photos_count", "rating", "reviews_count", "slug", "price_low", "price_high",
+)
+_SEED_ROWS = sorted(
+    ({col: camp_data[col] for col in _CAMP_COLS} for camp_data in SEED_CAMPGROUNDS),
+    key=itemgetter("id")
+)
+_SEED_PHOTO_ROWS = sorted(
+    ({"campground_id": camp_data["id"], "url": url}
+     for camp_data in SEED_CAMPGROUNDS for url in camp_data["photo_urls"]),
+    key=itemgetter("campground_id", "url")
+)
+_SEED_CAMPER_TYPES = [
+    (camp_data["id"], name) for camp_data in SEED_CAMPGROUNDS for name in camp_data["camper_types"]
+]
+_SEED_ACCOMMODATION_TYPES = [
+    (camp_data["id"], name) for camp_data in SEED_CAMPGROUNDS for name in camp_data["accommodation_types"]
+]
+
+async def _get_type_ids(session, model, names):
+    """
+    Return a name -> id mapping for the given type names, creating missing ones
+
+    ON CONFLICT DO NOTHING makes the insert safe against concurrent seeds/scrapes.
+    """
+    await session.execute(
+        pg_insert(model)
+        .values([{"name": name} for name in sorted(names)])
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    result = await session.execute(select(model.id, model.name).where(in_array(model.name, names)))
+    return {name: type_id for type_id, name in result.all()}
+
+async def _load(session, stmt, table, rows):
+    """
+    Insert `rows` into `table`, rebuilding its indexes afterwards for large loads
+    """
+    if not rows:
+        return
+    async with AsyncExitStack() as stack:
+        if len(rows) >= BULK_LOAD_INDEX_THRESHOLD:
+            await stack.enter_async_context(bulk_load_mode(session, (table,)))
+        if table is Campground.__table__ and len(rows) >= COPY_THRESHOLD:
+            await bulk_copy_campgrounds(session, rows)
+        else:
+            await session.execute(stmt, rows)
+
 async def seed_database():
     """
     Initialize the database and seed it with test data
+
+    Everything is written in one transaction, so a failed seed leaves nothing behind.
     """
     logger.info("Initializing database schema...")
     await init_db()
     
     # Create a session
     async with async_session_factory() as session:
-        logger.info("Seeding database with test data...")
-        
-        # Create a test scraper log
-        scraper_log = ScraperLog(
-            start_time=datetime.utcnow(),
-            end_time=datetime.utcnow(),
-            status="success",
-            records_processed=len(SEED_CAMPGROUNDS),
-            records_added=len(SEED_CAMPGROUNDS),
-            records_updated=0
-        )
-        session.add(scraper_log)
-        
-        # Process each test campground
-        for camp_data in SEED_CAMPGROUNDS:
-            # Create campground
-            campground = Campground(
-                id=camp_data["id"],
-                type=camp_data["type"],
-                links_self=camp_data["links_self"],
-                name=camp_data["name"],
-                latitude=camp_data["latitude"],
-                longitude=camp_data["longitude"],
-                region_name=camp_data["region_name"],
-                administrative_area=camp_data["administrative_area"],
-                nearest_city_name=camp_data["nearest_city_name"],
-                bookable=camp_data["bookable"],
-                operator=camp_data["operator"],
-                photo_url=camp_data["photo_url"],
-                photos_count=camp_data["photos_count"],
-                rating=camp_data["rating"],
-                reviews_count=camp_data["reviews_count"],
-                slug=camp_data["slug"],
-                price_low=camp_data["price_low"],
-                price_high=camp_data["price_high"]
+        async with session.begin():
+            logger.info("Seeding database with test data...")
+            
+            # Check foreign keys once at COMMIT instead of after every statement
+            await session.execute(text("SET CONSTRAINTS ALL DEFERRED"))
+            
+            # Create a test scraper log
+            now = datetime.utcnow()
+            scraper_log = ScraperLog(
+                start_time=now,
+                end_time=now,
+                status="success",
+                records_processed=len(SEED_CAMPGROUNDS),
+                records_added=len(SEED_CAMPGROUNDS)
             )
-            session.add(campground)
-            await session.flush()
+            session.add(scraper_log)
             
-            # Process camper types
-            for ct_name in camp_data["camper_types"]:
-                # Check if camper type exists
-                ct = await session.execute(
-                    f"SELECT id FROM camper_types WHERE name = '{ct_name}'"
-                )
-                ct_id = ct.scalar()
-                
-                if not ct_id:
-                    # Create new camper type
-                    camper_type = CamperType(name=ct_name)
-                    session.add(camper_type)
-                    await session.flush()
-                    ct_id = camper_type.id
-                
-                # Add relationship
-                await session.execute(
-                    f"INSERT INTO campground_camper_types (campground_id, camper_type_id) VALUES ('{campground.id}', {ct_id})"
-                )
+            # Resolve every camper / accommodation type id up front
+            ct_ids = await _get_type_ids(session, CamperType, {name for _, name in _SEED_CAMPER_TYPES})
+            at_ids = await _get_type_ids(session, AccommodationType, {name for _, name in _SEED_ACCOMMODATION_TYPES})
             
-            # Process accommodation types
-            for at_name in camp_data["accommodation_types"]:
-                # Check if accommodation type exists
-                at = await session.execute(
-                    f"SELECT id FROM accommodation_types WHERE name = '{at_name}'"
-                )
-                at_id = at.scalar()
-                
-                if not at_id:
-                    # Create new accommodation type
-                    acc_type = AccommodationType(name=at_name)
-                    session.add(acc_type)
-                    await session.flush()
-                    at_id = acc_type.id
-                
-                # Add relationship
-                await session.execute(
-                    f"INSERT INTO campground_accommodation_types (campground_id, accommodation_type_id) VALUES ('{campground.id}', {at_id})"
-                )
+            # Association rows only need the type ids resolved above, sorted like their primary keys
+            camper_type_rows = sorted(
+                ({"campground_id": camp_id, "camper_type_id": ct_ids[name]} for camp_id, name in _SEED_CAMPER_TYPES),
+                key=itemgetter("campground_id", "camper_type_id")
+            )
+            accommodation_type_rows = sorted(
+                ({"campground_id": camp_id, "accommodation_type_id": at_ids[name]} for camp_id, name in _SEED_ACCOMMODATION_TYPES),
+                key=itemgetter("campground_id", "accommodation_type_id")
+            )
             
-            # Add photo URLs
-            for url in camp_data["photo_urls"]:
-                photo = PhotoUrl(
-                    campground_id=campground.id,
-                    url=url
-                )
-                session.add(photo)
-        
-        # Commit all changes
-        await session.commit()
-        
-        logger.success(f"Successfully seeded database with {len(SEED_CAMPGROUNDS)} campgrounds.")
+            await _load(session, insert(Campground), Campground.__table__, _SEED_ROWS)
+            await _load(
+                session,
+                pg_insert(PhotoUrl).on_conflict_do_nothing(index_elements=["campground_id", "url"]),
+                PhotoUrl.__table__, _SEED_PHOTO_ROWS
+            )
+            await _load(session, insert(campground_camper_types), campground_camper_types, camper_type_rows)
+            await _load(session, insert(campground_accommodation_types), campground_accommodation_types, accommodation_type_rows)
+    
+    logger.success(f"Successfully seeded database with {len(SEED_CAMPGROUNDS)} campgrounds.")
 
 if __name__ == "__main__":
     asyncio.run(seed_database())
\ No newline at end of file
@@ -3,56 +3,60 @@
 Pydantic models for data validation
 """
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import Annotated, List, Dict, Any, Optional
 
-from pydantic import BaseModel, Field, validator, HttpUrl
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 class Campground(BaseModel):
     """
     Pydantic model for campground data validation
     """
-    id: str
-    type: str
-    links: Dict[str, str] = Field(default_factory=dict)
-    name: str
+    # String limits mirror the database columns, so an over-long value fails
+    # validation for its own record instead of the INSERT of a whole chunk
+    id: str = Field(max_length=64)
+    type: str = Field(max_length=32)
+    links: Dict[str, Annotated[str, Field(max_length=512)]] = Field(default_factory=dict)
+    name: str = Field(max_length=255)
     latitude: Optional[float] = None
     longitude: Optional[float] = None
-    region_name: Optional[str] = None
-    administrative_area: Optional[str] = None
-    nearest_city_name: Optional[str] = None
+    region_name: Optional[str] = Field(default=None, max_length=128)
+    administrative_area: Optional[str] = Field(default=None, max_length=128)
+    nearest_city_name: Optional[str] = Field(default=None, max_length=128)
     accommodation_type_names: List[str] = Field(default_factory=list)
     bookable: bool = False
     camper_types: List[str] = Field(default_factory=list)
-    operator: Optional[str] = None
-    photo_url: Optional[Union[HttpUrl, str]] = None
-    photo_urls: List[Union[HttpUrl, str]] = Field(default_factory=list)
+    operator: Optional[str] = Field(default=None, max_length=255)
+    photo_url: Optional[str] = Field(default=None, max_length=1024)
+    photo_urls: List[Annotated[str, Field(max_length=1024)]] = Field(default_factory=list)
     photos_count: int = 0
     rating: Optional[float] = None
     reviews_count: int = 0
-    slug: Optional[str] = None
+    slug: Optional[str] = Field(default=None, max_length=255)
     price_low: Optional[float] = None
     price_high: Optional[float] = None
     availability_updated_at: Optional[datetime] = None
-    address: Optional[str] = None  # Bonus field from geocoding
+    address: Optional[str] = Field(default=None, max_length=512)  # Bonus field from geocoding
     
-    class Config:
-        arbitrary_types_allowed = True
+    # Instances are never modified after parsing; unknown keys are dropped.
+    # Validation also accepts the API's hyphenated attribute names (photo-url -> photo_url),
+    # output keeps the field names.
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        frozen=True,
+        extra='ignore',
+        alias_generator=AliasGenerator(validation_alias=lambda name: name.replace('_', '-')),
+        populate_by_name=True,
+    )
         
-    @validator('links', pre=True)
+    @field_validator('links', mode='before')
+    @classmethod
     def validate_links(cls, v):
         """Ensure links is a dictionary"""
         if not isinstance(v, dict):
             return {'self': str(v) if v else ''}
         return v
-        
-    @validator('photo_url', 'photo_urls', pre=True)
-    def validate_urls(cls, v):
-        """Handle URL validation"""
-        if v is None:
-            return v
-        # For single URL
-        if not isinstance(v, list):
-            return str(v)
-        # For list of URLs
-        return [str(url) for url in v]
\ No newline at end of file
+
+
+# Validates a whole page of campgrounds in one call into pydantic-core
+CAMPGROUND_LIST = TypeAdapter(List[Campground])
@@ -4,21 +4,240 @@
 The Dyrt website scraper 
 """
 import asyncio
-import json
+import importlib.util
+import math
+import sqlite3
+import sys
 import time
+from collections import defaultdict
+from contextlib import closing
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
+import hishel
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import ijson
+import orjson
+from aiolimiter import AsyncLimiter
+from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception_type
 from geopy.geocoders import Nominatim
+from pydantic import ValidationError
 
 from src.config import (
     DYRT_API_URL, DEFAULT_HEADERS, MAX_RETRIES, RETRY_BACKOFF, 
-    USE_GEOCODING, logger
+    SCRAPER_SAVE_BATCH_SIZE, SCRAPER_CONCURRENCY, HTTP_CACHE_DIR, HTTP_CACHE_TTL,
+    USE_GEOCODING, GEOCODE_CACHE_FILE, GEOCODE_CACHE_TTL, GEOCODE_RATE_LIMIT, logger
 )
-from src.models.campground import Campground
-from src.database.db import save_campgrounds
+from src.models.campground import Campground, CAMPGROUND_LIST
+from src.database.db import save_campgrounds, write_scraper_log
+
+
+class _AsyncBytesReader:
+    """
+    Async file-like wrapper around an async byte iterator, as ijson expects
+    """
+    def __init__(self, chunks):
+        self._chunks = chunks.__aiter__()
+        
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0)
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO timestamp; many campgrounds share the same bulk update time
+    """
+    return datetime.fromisoformat(value)
+
+
+class _BatchWriter:
+    """
+    Collects parsed campgrounds and saves them `batch_size` at a time, one batch after another
+    """
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.totals = {"processed": 0, "added": 0, "updated": 0}
+        self.error: Optional[Exception] = None
+        self._pending: List[Campground] = []
+        self._lock = asyncio.Lock()
+        
+    async def add(self, campgrounds: List[Campground]):
+        self.totals["processed"] += len(campgrounds)
+        self._pending.extend(campgrounds)
+        if len(self._pending) >= self.batch_size:
+            # Producers wait here while a batch is being saved, which bounds memory
+            await self.flush()
+            
+    async def flush(self):
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            if not batch or self.error is not None:
+                return
+            try:
+                result = await save_campgrounds(batch)
+            except Exception as e:
+                # Kept for run() to re-raise; the remaining tiles are no longer saved
+                self.error = e
+                return
+            self.totals["added"] += result["added"]
+            self.totals["updated"] += result["updated"]
+
+
+class _GeocodeCache:
+    """
+    Reverse geocoding results in SQLite, shared by every scraper process
+
+    Each call opens its own short-lived connection, so the methods are safe to
+    run with asyncio.to_thread and no process holds the file between lookups.
+    """
+    def __init__(self, path):
+        self.path = str(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            # WAL lets a scheduled and a one-off scrape read while the other writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS geocode (key TEXT PRIMARY KEY, address TEXT, stored_at REAL NOT NULL)")
+            
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+        
+    def get(self, key: str) -> Optional[Tuple[float, Optional[str]]]:
+        """
+        (stored_at, address) for `key`, or None when it was never looked up
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT stored_at, address FROM geocode WHERE key = ?", (key,)).fetchone()
+        return row
+        
+    def set(self, key: str, address: Optional[str]):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO geocode (key, address, stored_at) VALUES (?, ?, ?)",
+                (key, address, time.time())
+            )
+
+
+# Search params according to working API format, only the bbox changes per request
+_BASE_PARAMS = MappingProxyType({
+    "filter[search][drive_time]": "any",
+    "filter[search][air_quality]": "any",
+    "filter[search][electric_amperage]": "any",
+    "filter[search][max_vehicle_length]": "any",
+    "filter[search][price]": "any",
+    "filter[search][rating]": "any",
+    "sort": "recommended",
+    "page[size]": 100,  # Reduced to avoid overwhelming
+    "page[number]": 1
+})
+_PAGE_SIZE = _BASE_PARAMS["page[size]"]
+# Subdivision aims for this many campgrounds per cell, leaving headroom under a page
+_CELL_TARGET = _PAGE_SIZE * 0.8
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the endpoint's circuit breaker is open
+    """
+
+
+class _CircuitBreaker:
+    """
+    Stops requests to an endpoint for `reset_timeout` seconds after `fail_max` consecutive failures
+
+    Once the timeout has passed a single probe request goes through while the
+    others keep failing fast; its failure reopens the breaker, its success closes it.
+    """
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        
+    def check(self, name: str):
+        if self._opened_at is None:
+            return
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            raise CircuitOpenError(f"Circuit breaker open for {name}")
+        # Half-open: restarting the timeout lets this request probe alone. Should
+        # the probe never report back, the next one is let through after another timeout
+        self._opened_at = now
+            
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        
+    def record_failure(self):
+        self._failures += 1
+        if self._failures >= self.fail_max or self._opened_at is not None:
+            self._opened_at = time.monotonic()
+
+
+_jittered_backoff = wait_random_exponential(multiplier=RETRY_BACKOFF, max=60)
+
+
+def _wait_retry_after_or_jitter(retry_state) -> float:
+    """
+    Wait as long as a 429/503 response's Retry-After asks, otherwise use full-jitter exponential backoff
+
+    The jitter keeps concurrent tile requests from retrying in lockstep.
+    """
+    error = retry_state.outcome.exception()
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code in (429, 503):
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), 60.0)
+    return _jittered_backoff(retry_state)
+
+
+_http_retry = retry(
+    stop=stop_after_attempt(MAX_RETRIES),
+    wait=_wait_retry_after_or_jitter,
+    retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
+    reraise=True
+)
+
+# Low-cardinality attributes repeated across many campgrounds
+_INTERNED_ATTRS = ("region-name", "administrative-area", "nearest-city-name", "operator")
+
+# Error bodies are logged up to this many bytes; larger successful bodies are rejected
+_ERROR_BODY_LOG_BYTES = 1000
+_MAX_BODY_BYTES = 10_000_000
+
+# Older API versions tried when the configured endpoint returns 404
+_ALTERNATIVE_API_URLS = (
+    "https://thedyrt.com/api/v5/locations/search-results",
+    "https://thedyrt.com/api/v4/locations/search-results",
+    "https://thedyrt.com/api/v3/locations/search-results",
+)
+
+class _SearchResultsController(hishel.Controller):
+    """
+    Cache controller that only stores successful JSON search results
+
+    force_cache makes hishel store any response, so without this a 429, 5xx,
+    404 or HTML error page would be replayed for the whole TTL.
+    """
+    def is_cachable(self, request, response) -> bool:
+        if response.status != 200:
+            return False
+        content_type = b"".join(value for key, value in response.headers if key.lower() == b"content-type")
+        return b"json" in content_type and super().is_cachable(request, response)
+
+
+# HTTP/2 multiplexes the concurrent API requests over one connection, when h2 is installed
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Nominatim's usage policy limits the client, not a scraper instance, so every scraper shares this
+_GEOCODE_LIMITER = AsyncLimiter(GEOCODE_RATE_LIMIT, 1)
 
 
 class DyrtScraper:
@@ -26,8 +245,33 @@ class DyrtScraper:
     Scraper for The Dyrt website
     """
     def __init__(self):
-        self.client = httpx.AsyncClient(headers=DEFAULT_HEADERS, timeout=30.0)
+        client_kwargs = dict(
+            headers=DEFAULT_HEADERS,
+            # Fail fast on connect and on waiting for a pooled connection, allow slow search responses
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+            http2=HTTP2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0)
+        )
+        if HTTP_CACHE_TTL > 0:
+            # Re-runs within the TTL read unchanged tiles from disk instead of the API.
+            # hishel reads every body in full before storing it, so responses are
+            # buffered in memory rather than streamed into ijson while the cache is on
+            storage = hishel.AsyncFileStorage(base_path=HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL)
+            self.client = hishel.AsyncCacheClient(storage=storage, controller=_SearchResultsController(), **client_kwargs)
+        else:
+            self.client = httpx.AsyncClient(**client_kwargs)
         self.geolocator = Nominatim(user_agent="TheDyrtScraper/1.0") if USE_GEOCODING else None
+        self._geo_cache = _GeocodeCache(GEOCODE_CACHE_FILE) if USE_GEOCODING else None
+        # Bounds the number of in-flight API requests across the whole subdivision tree
+        self._sem = asyncio.Semaphore(SCRAPER_CONCURRENCY)
+        self._breakers: Dict[str, _CircuitBreaker] = defaultdict(_CircuitBreaker)
+        self._skipped_tiles = 0
+        # Search endpoint in use; switched to an older API version if this one starts returning 404
+        self._api_url = DYRT_API_URL
+        self._api_url_lock = asyncio.Lock()
+        # The cookie jar is filled once per scraper, not before every request
+        self._auth_done = asyncio.Event()
+        self._auth_lock = asyncio.Lock()
         
     async def __aenter__(self):
         return self
@@ -49,10 +293,10 @@ class DyrtScraper:
             logger.info("Fetching authentication token...")
             
             # First visit the main page to get cookies
-            response = await self.client.get("https://thedyrt.com/search")
+            response = await self._get_with_retry("https://thedyrt.com/search")
             
             # Log status code and response info
-            logger.debug(f"Main page status code: {response.status_code}")
+            logger.debug("Main page status code: {}", response.status_code)
             
             # Check if we have any cookies set
             cookies = self.client.cookies
@@ -63,103 +307,176 @@ class DyrtScraper:
             logger.error(f"Error getting auth token: {e}")
             return False
     
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(multiplier=RETRY_BACKOFF),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
-        reraise=True
-    )
-    async def fetch_campgrounds(self, bounds: Dict[str, float], zoom: int = 5) -> Tuple[List[Dict[str, Any]], bool]:
+    @_http_retry
+    async def _get_with_retry(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET `url`, retrying transport errors with the scraper's backoff
+        """
+        return await self.client.get(url, **kwargs)
+    
+    async def ensure_auth(self):
+        """
+        Run get_auth_token once, concurrent callers wait for the first one
+        """
+        if self._auth_done.is_set():
+            return
+        async with self._auth_lock:
+            if not self._auth_done.is_set():
+                await self.get_auth_token()
+                self._auth_done.set()
+    
+    @_http_retry
+    async def fetch_campgrounds(self, bounds: Dict[str, float], zoom: int = 5) -> Tuple[List[Dict[str, Any]], int]:
         """
         Fetch campgrounds from The Dyrt API within the given bounds
+
+        Returns the first page of campgrounds and the total record count.
         """
-        # Get authentication before making requests
-        await self.get_auth_token()
-        
-        # Build bbox parameter - format: "sw_lng,sw_lat,ne_lng,ne_lat"
-        bbox_value = f"{bounds['sw_lng']},{bounds['sw_lat']},{bounds['ne_lng']},{bounds['ne_lat']}"
-        
-        # Build params according to working API format
-        params = {
-            "filter[search][bbox]": bbox_value,
-            "filter[search][drive_time]": "any",
-            "filter[search][air_quality]": "any",
-            "filter[search][electric_amperage]": "any",
-            "filter[search][max_vehicle_length]": "any",
-            "filter[search][price]": "any",
-            "filter[search][rating]": "any",
-            "sort": "recommended",
-            "page[size]": 100,  # Reduced to avoid overwhelming
-            "page[number]": 1
-        }
-        
-        try:
-            # Log request details
-            logger.debug(f"Making API request to: {DYRT_API_URL}")
-            logger.debug(f"With bbox: {bbox_value}")
+        async with self._sem:
+            # Get authentication before the first request
+            await self.ensure_auth()
             
-            # Make API request
-            response = await self.client.get(DYRT_API_URL, params=params)
+            # Build bbox parameter - format: "sw_lng,sw_lat,ne_lng,ne_lat"
+            bbox_value = f"{bounds['sw_lng']},{bounds['sw_lat']},{bounds['ne_lng']},{bounds['ne_lat']}"
             
-            # Log response status
-            logger.debug(f"Response status: {response.status_code}")
+            params = {"filter[search][bbox]": bbox_value, **_BASE_PARAMS}
             
-            # Handle different status codes
-            if response.status_code == 404:
-                logger.error("API endpoint not found. The endpoint may have changed.")
-                # Try alternative endpoints
-                alternative_urls = [
-                    "https://thedyrt.com/api/v5/locations/search-results",
-                    "https://thedyrt.com/api/v4/locations/search-results",
-                    "https://thedyrt.com/api/v3/locations/search-results"
-                ]
+            try:
+                # Log request details
+                # Arguments are only formatted when DEBUG is enabled
+                url = self._api_url
+                logger.debug("Making API request to: {} with bbox: {}", url, bbox_value)
                 
-                for alt_url in alternative_urls:
-                    logger.info(f"Trying alternative endpoint: {alt_url}")
-                    alt_response = await self.client.get(alt_url, params=params)
-                    if alt_response.status_code == 200:
-                        logger.success(f"Success with alternative endpoint: {alt_url}")
-                        response = alt_response
-                        break
-                else:
-                    logger.error("All alternative endpoints failed")
-                    raise httpx.HTTPStatusError(f"API endpoint not found", request=response.request, response=response)
-            
-            # Check for other errors
-            if response.status_code >= 400:
-                logger.error(f"API Error: Status {response.status_code}")
-                logger.error(f"Response: {response.text[:1000]}")
-            
-            response.raise_for_status()
-    
-            # Parse JSON response
-            data = response.json()
-            
-            logger.debug(f"API returned keys: {list(data.keys())}")
+                # Make API request
+                response, campgrounds, record_count = await self.request_search_results(url, params)
+                
+                # Log response status
+                logger.debug("Response status: {}", response.status_code)
+                
+                # Handle different status codes
+                if response.status_code == 404:
+                    response, campgrounds, record_count = await self.request_alternative_endpoints(url, params, response)
+                
+                # Check for other errors
+                if response.status_code >= 400:
+                    logger.error(f"API Error: Status {response.status_code}")
+                
+                response.raise_for_status()
+                
+                # Check if too many results
+                if record_count > _PAGE_SIZE:
+                    logger.info(f"Too many results ({record_count}) for bounds. Need to subdivide.")
+                
+                logger.info(f"Retrieved {len(campgrounds)} campgrounds")
+                
+                return campgrounds, record_count
             
-            # Check if too many results
-            meta = data.get("meta", {})
-            record_count = meta.get("record-count", 0)
-            too_many_results = record_count > 100
+            except httpx.HTTPError as e:
+                logger.error(f"HTTP error fetching campgrounds: {e}")
+                raise
+            except (ijson.JSONError, orjson.JSONDecodeError) as e:
+                logger.error(f"JSON decode error: {e}")
+                raise
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                logger.error(f"Error fetching campgrounds: {e}")
+                raise
     
-            if too_many_results:
-                logger.info(f"Too many results ({record_count}) for bounds. Need to subdivide.")
+    async def request_alternative_endpoints(self, failed_url: str, params: Dict[str, Any],
+                                            response: httpx.Response) -> Tuple[httpx.Response, List[Dict[str, Any]], int]:
+        """
+        Find a working endpoint after `failed_url` returned 404 and remember it for later requests
+        """
+        # One task probes, the others wait and reuse whatever it found
+        async with self._api_url_lock:
+            if self._api_url != failed_url:
+                return await self.request_search_results(self._api_url, params)
+                
+            logger.error("API endpoint not found. The endpoint may have changed.")
+            # Probe all alternatives at once and take the first that answers 200
+            probes = {
+                asyncio.create_task(self.request_search_results(alt_url, params)): alt_url
+                for alt_url in _ALTERNATIVE_API_URLS if alt_url != failed_url
+            }
+            logger.info(f"Trying alternative endpoints: {list(probes.values())}")
+            pending = set(probes)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None and task.result()[0].status_code == 200:
+                            alt_url = probes[task]
+                            logger.success(f"Success with alternative endpoint: {alt_url}")
+                            self._api_url = alt_url
+                            return task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+                    
+            logger.error("All alternative endpoints failed")
+            raise httpx.HTTPStatusError(f"API endpoint not found", request=response.request, response=response)
     
-            # Extract campgrounds
-            campgrounds = data.get("data", [])
-            logger.info(f"Retrieved {len(campgrounds)} campgrounds")
-            
-            return campgrounds, too_many_results
-            
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error fetching campgrounds: {e}")
-            raise
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            logger.error(f"Raw response: {response.text[:500]}...")
-            raise
-        except Exception as e:
-            logger.error(f"Error fetching campgrounds: {e}")
+    async def request_search_results(self, url: str, params: Dict[str, Any]) -> Tuple[httpx.Response, List[Dict[str, Any]], int]:
+        """
+        GET a search results page
+
+        Returns the response, the campgrounds and meta.record-count. Error
+        responses come back with no campgrounds. The plain client parses the
+        body while it streams in; the caching client has already read it in
+        full, so it is decoded in one orjson call instead.
+        """
+        # Each endpoint has its own breaker, so probing alternatives can't trip the main one
+        breaker = self._breakers[url]
+        breaker.check(url)
+        
+        try:
+            # The API doesn't send cache headers, force_cache keeps responses for HTTP_CACHE_TTL
+            async with self.client.stream("GET", url, params=params, extensions={"force_cache": True}) as response:
+                if response.status_code == 429 or response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                
+                if response.status_code >= 400:
+                    # Only the logged prefix of an error body is read, however large it is
+                    body = b""
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        if len(body) >= _ERROR_BODY_LOG_BYTES:
+                            break
+                    logger.error("Response: {}", body[:_ERROR_BODY_LOG_BYTES].decode("utf-8", "replace"))
+                    return response, [], 0
+                
+                # Don't parse an HTML error page or a runaway body served with a 200
+                content_type = response.headers.get("content-type", "")
+                if "json" not in content_type:
+                    raise ValueError(f"Unexpected content type {content_type!r} from {url}")
+                if int(response.headers.get("content-length", 0)) > _MAX_BODY_BYTES:
+                    raise ValueError(f"Response from {url} exceeds {_MAX_BODY_BYTES} bytes")
+                
+                if isinstance(self.client, hishel.AsyncCacheClient):
+                    data = orjson.loads(await response.aread())
+                    return response, data.get("data") or [], (data.get("meta") or {}).get("record-count", 0)
+                
+                campgrounds = []
+                record_count = 0
+                builder = None
+                # Only one campground is held as a partially built object at a time
+                async for prefix, event, value in ijson.parse_async(_AsyncBytesReader(response.aiter_bytes()), use_float=True):
+                    if prefix == "data.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "data.item" and event == "end_map":
+                            campgrounds.append(builder.value)
+                            builder = None
+                    elif prefix == "meta.record-count":
+                        record_count = value
+                
+                return response, campgrounds, record_count
+        except httpx.TransportError:
+            breaker.record_failure()
             raise
     
     async def get_address_from_coords(self, lat: float, lng: float) -> Optional[str]:
@@ -168,136 +485,221 @@ class DyrtScraper:
         """
         if not self.geolocator:
             return None
+        
+        # ~11 m precision, nearby lookups share one cache entry
+        key = f"{round(lat, 4)},{round(lng, 4)}"
+        # Anything older than the TTL is looked up again
+        cached = await asyncio.to_thread(self._geo_cache.get, key)
+        if cached is not None and time.time() - cached[0] < GEOCODE_CACHE_TTL:
+            return cached[1]
             
         try:
-            location = self.geolocator.reverse(f"{lat}, {lng}")
-            return location.address if location else None
+            # geopy blocks, run it in a thread and keep to Nominatim's rate limit
+            async with _GEOCODE_LIMITER:
+                location = await asyncio.to_thread(self.geolocator.reverse, f"{lat}, {lng}", timeout=15)
+            address = location.address if location else None
+            await asyncio.to_thread(self._geo_cache.set, key, address)
+            return address
         except Exception as e:
             logger.warning(f"Error getting address from coordinates: {e}")
             return None
     
-    def subdivide_bounds(self, bounds: Dict[str, float]) -> List[Dict[str, float]]:
+    def subdivide_bounds(self, bounds: Dict[str, float], n: int = 2) -> List[Dict[str, float]]:
         """
-        Subdivide bounds into 4 smaller bounds
+        Subdivide bounds into an n x n grid of smaller bounds
         """
-        # Calculate midpoints
-        mid_lat = (bounds["ne_lat"] + bounds["sw_lat"]) / 2
-        mid_lng = (bounds["ne_lng"] + bounds["sw_lng"]) / 2
+        lat_step = (bounds["ne_lat"] - bounds["sw_lat"]) / n
+        lng_step = (bounds["ne_lng"] - bounds["sw_lng"]) / n
+        
+        # Reuse the outer edges as-is so float steps never leave gaps at the border
+        lats = [bounds["sw_lat"] + i * lat_step for i in range(n)] + [bounds["ne_lat"]]
+        lngs = [bounds["sw_lng"] + j * lng_step for j in range(n)] + [bounds["ne_lng"]]
         
-        # Create 4 smaller bounds
         return [
-            # Northwest
-            {
-                "ne_lat": bounds["ne_lat"],
-                "ne_lng": mid_lng,
-                "sw_lat": mid_lat,
-                "sw_lng": bounds["sw_lng"]
-            },
-            # Northeast
-            {
-                "ne_lat": bounds["ne_lat"],
-                "ne_lng": bounds["ne_lng"],
-                "sw_lat": mid_lat,
-                "sw_lng": mid_lng
-            },
-            # Southwest
             {
-                "ne_lat": mid_lat,
-                "ne_lng": mid_lng,
-                "sw_lat": bounds["sw_lat"],
-                "sw_lng": bounds["sw_lng"]
-            },
-            # Southeast
-            {
-                "ne_lat": mid_lat,
-                "ne_lng": bounds["ne_lng"],
-                "sw_lat": bounds["sw_lat"],
-                "sw_lng": mid_lng
+                "ne_lat": lats[i + 1],
+                "ne_lng": lngs[j + 1],
+                "sw_lat": lats[i],
+                "sw_lng": lngs[j]
             }
+            for i in range(n) for j in range(n)
         ]
     
-    async def process_bounds(self, bounds: Dict[str, float], depth: int = 0, max_depth: int = 3) -> List[Dict[str, Any]]:
+    async def process_bounds(
+        self, bounds: Dict[str, float], depth: int = 0, max_depth: int = 3,
+        on_tile: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None,
+        seen_ids: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Process bounds recursively
+
+        With `on_tile`, each tile's campgrounds are handed to it as soon as
+        they are fetched instead of being collected and returned.
+        `seen_ids` is shared by the whole recursion so campgrounds on the
+        border of adjacent tiles are only kept once.
         """
+        if seen_ids is None:
+            seen_ids = set()
+        
         if depth > max_depth:
             logger.warning(f"Maximum recursion depth reached for bounds: {bounds}")
             return []
             
         try:
             # Fetch campgrounds
-            campgrounds, too_many_results = await self.fetch_campgrounds(bounds)
+            campgrounds, record_count = await self.fetch_campgrounds(bounds)
             
             # If too many results, subdivide and process each
-            if too_many_results and depth < max_depth:
-                logger.info(f"Subdividing bounds at depth {depth}")
-                subdivided_bounds = self.subdivide_bounds(bounds)
+            if record_count > _PAGE_SIZE and depth < max_depth:
+                # Size the grid from record-count so each cell should fit in one page
+                n = max(2, math.ceil(math.sqrt(record_count / _CELL_TARGET)))
+                logger.info(f"Subdividing bounds at depth {depth} into {n}x{n}")
+                subdivided_bounds = self.subdivide_bounds(bounds, n)
+                
+                # Process the subdivisions concurrently, the semaphore limits the requests in flight
+                results = await asyncio.gather(
+                    *(self.process_bounds(sub_bounds, depth + 1, max_depth, on_tile, seen_ids) for sub_bounds in subdivided_bounds),
+                    return_exceptions=True
+                )
                 
-                # Process each subdivision
                 all_campgrounds = []
-                for sub_bounds in subdivided_bounds:
-                    sub_campgrounds = await self.process_bounds(sub_bounds, depth + 1, max_depth)
+                for sub_bounds, sub_campgrounds in zip(subdivided_bounds, results):
+                    if isinstance(sub_campgrounds, BaseException):
+                        logger.error(f"Error processing bounds {sub_bounds}: {sub_campgrounds}")
+                        continue
                     all_campgrounds.extend(sub_campgrounds)
                     
                 return all_campgrounds
+            
+            # Drop campgrounds an adjacent tile already returned
+            new_campgrounds = []
+            for camp_data in campgrounds:
+                camp_id = camp_data.get("id")
+                if camp_id not in seen_ids:
+                    seen_ids.add(camp_id)
+                    new_campgrounds.append(camp_data)
+            campgrounds = new_campgrounds
+            
+            if on_tile is not None:
+                await on_tile(campgrounds)
+                return []
             else:
                 return campgrounds
+        except CircuitOpenError as e:
+            # The API is failing, don't subdivide into more doomed requests
+            logger.warning(f"Skipping bounds {bounds}: {e}")
+            self._skipped_tiles += 1
+            return []
         except Exception as e:
             logger.error(f"Error processing bounds {bounds}: {e}")
+            self._skipped_tiles += 1
             return []
     
-    async def parse_campground(self, camp_data: Dict[str, Any]) -> Campground:
+    def campground_record(self, camp_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Parse campground data into Pydantic model
+        Raw API data in the shape Campground validates, without validating
+
+        The API's hyphenated attribute names are mapped onto the fields by the model's aliases.
         """
-        # Extract attributes
         attrs = camp_data.get("attributes", {})
-        
-        # Get or calculate fields
-        latitude = attrs.get("latitude")
-        longitude = attrs.get("longitude")
+        record = {
+            # Missing names are stored as empty strings rather than dropping the campground
+            "name": "",
+            "region-name": "",
+            **attrs,
+            "id": camp_data.get("id"),
+            "type": camp_data.get("type"),
+            "links": {"self": camp_data.get("links", {}).get("self", "")},
+        }
+        # Thousands of records share a handful of these values, keep one copy of each
+        for key in _INTERNED_ATTRS:
+            value = attrs.get(key)
+            if isinstance(value, str):
+                record[key] = sys.intern(value)
+        updated_at = attrs.get("availability-updated-at")
+        if updated_at:
+            record["availability-updated-at"] = _parse_iso(updated_at)
+        return record
+    
+    async def campground_fields(self, camp_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        campground_record() plus the reverse geocoded address
+        """
+        record = self.campground_record(camp_data)
         
         # Get address (bonus)
-        address = None
+        latitude = record.get("latitude")
+        longitude = record.get("longitude")
         if USE_GEOCODING and latitude and longitude:
             address = await self.get_address_from_coords(latitude, longitude)
-        
-        # Create Campground model
-        campground = Campground(
-            id=camp_data.get("id"),
-            type=camp_data.get("type"),
-            links={"self": camp_data.get("links", {}).get("self", "")},
-            name=attrs.get("name", ""),
-            latitude=latitude,
-            longitude=longitude,
-            region_name=attrs.get("region-name", ""),
-            administrative_area=attrs.get("administrative-area"),
-            nearest_city_name=attrs.get("nearest-city-name"),
-            accommodation_type_names=attrs.get("accommodation-type-names", []),
-            bookable=attrs.get("bookable", False),
-            camper_types=attrs.get("camper-types", []),
-            operator=attrs.get("operator"),
-            photo_url=attrs.get("photo-url"),
-            photo_urls=attrs.get("photo-urls", []),
-            photos_count=attrs.get("photos-count", 0),
-            rating=attrs.get("rating"),
-            reviews_count=attrs.get("reviews-count", 0),
-            slug=attrs.get("slug"),
-            price_low=attrs.get("price-low"),
-            price_high=attrs.get("price-high"),
-            availability_updated_at=datetime.fromisoformat(attrs["availability-updated-at"]) if attrs.get("availability-updated-at") else None,
-        )
-        
-        # Add address if available
-        if address:
-            setattr(campground, "address", address)
+            if address:
+                record["address"] = address
             
-        return campground
+        return record
+    
+    async def parse_campground(self, camp_data: Dict[str, Any]) -> Campground:
+        """
+        Parse campground data into Pydantic model
+        """
+        return Campground.model_validate(await self.campground_fields(camp_data))
+    
+    async def parse_campgrounds(self, raw_campgrounds: List[Dict[str, Any]]) -> List[Campground]:
+        """
+        Parse raw API data into Pydantic models, dropping the invalid ones
+        """
+        if USE_GEOCODING:
+            # Concurrently, so geocoding lookups overlap under the rate limiter
+            results = await asyncio.gather(
+                *(self.campground_fields(camp_data) for camp_data in raw_campgrounds),
+                return_exceptions=True
+            )
+        else:
+            # Nothing to await, don't schedule a coroutine per record
+            results = []
+            for camp_data in raw_campgrounds:
+                try:
+                    results.append(self.campground_record(camp_data))
+                except Exception as e:
+                    results.append(e)
+        records = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Error parsing campground: {result}")
+                continue
+            records.append(result)
+        
+        # Validate the whole batch at once; fall back to per-record
+        # validation only to drop the invalid ones
+        try:
+            return CAMPGROUND_LIST.validate_python(records)
+        except ValidationError:
+            parsed_campgrounds = []
+            for record in records:
+                try:
+                    parsed_campgrounds.append(Campground.model_validate(record))
+                except ValidationError as e:
+                    logger.error(f"Error parsing campground {record.get('id')}: {e}")
+            return parsed_campgrounds
     
     async def run(self) -> Dict[str, int]:
         """
         Run the scraper to fetch all campgrounds in the US
+
+        The scraper stays open so it can be run again; close() it when done.
         """
+        # A long-lived scraper starts every run with fresh cookies, endpoint and breakers
+        self.client.cookies.clear()
+        self._auth_done.clear()
+        self._api_url = DYRT_API_URL
+        self._breakers.clear()
+        # Bounds given up on because of errors or an open breaker; the run is partial if any
+        self._skipped_tiles = 0
+        
+        # Parsed campgrounds are saved in batches while the scrape goes on
+        writer = _BatchWriter(SCRAPER_SAVE_BATCH_SIZE)
+        start_time = datetime.utcnow()
+        error: Optional[BaseException] = None
+        
         try:
             # Start with smaller bounds for testing
             test_bounds = {
@@ -311,6 +713,13 @@ class DyrtScraper:
             logger.info("Starting to scrape campgrounds in test area")
             raw_campgrounds = await self.process_bounds(test_bounds)
             
+            async def save_tile(tile: List[Dict[str, Any]]):
+                if writer.error is None:
+                    await writer.add(await self.parse_campgrounds(tile))
+                if writer.error is not None:
+                    # Saving failed, stop fetching and geocoding tiles that would never be stored
+                    us_scrape.cancel()
+            
             # If test works, expand to full US
             if raw_campgrounds:
                 logger.success(f"Test successful! Found {len(raw_campgrounds)} campgrounds")
@@ -324,52 +733,100 @@ class DyrtScraper:
                 }
                 
                 logger.info("Expanding to full US bounds")
-                raw_campgrounds = await self.process_bounds(us_bounds)
-            
-            # Log stats
-            logger.info(f"Raw campgrounds count: {len(raw_campgrounds)}")
-            
-            # Parse campgrounds into Pydantic models
-            logger.info(f"Parsing {len(raw_campgrounds)} campgrounds")
-            parsed_campgrounds = []
-            for camp_data in raw_campgrounds:
+                us_scrape = asyncio.create_task(self.process_bounds(us_bounds, on_tile=save_tile))
                 try:
-                    campground = await self.parse_campground(camp_data)
-                    parsed_campgrounds.append(campground)
-                except Exception as e:
-                    logger.error(f"Error parsing campground: {e}")
-                    continue
+                    await us_scrape
+                except asyncio.CancelledError:
+                    if writer.error is None:
+                        raise
             
-            # Save to database
-            logger.info(f"Saving {len(parsed_campgrounds)} campgrounds to database")
-            result = await save_campgrounds(parsed_campgrounds)
+            # Save the last partial batch
+            await writer.flush()
+            if writer.error is not None:
+                raise writer.error
             
-            logger.success(f"Scraper completed. Added: {result['added']}, Updated: {result['updated']}")
+            result = {**writer.totals, "skipped_tiles": self._skipped_tiles}
+            if self._skipped_tiles:
+                logger.warning(
+                    f"Scraper completed partially, {self._skipped_tiles} bounds skipped. "
+                    f"Added: {result['added']}, Updated: {result['updated']}"
+                )
+            else:
+                logger.success(f"Scraper completed. Added: {result['added']}, Updated: {result['updated']}")
             return result
-        except Exception as e:
-            logger.error(f"Error running scraper: {e}")
+        except BaseException as e:
+            error = e
+            if isinstance(e, Exception):
+                logger.error(f"Error running scraper: {e}")
             raise
         finally:
-            await self.close()
+            await self.log_run(start_time, {**writer.totals, "skipped_tiles": self._skipped_tiles}, error)
+    
+    async def log_run(self, start_time: datetime, totals: Dict[str, int], error: Optional[BaseException]):
+        """
+        Record the run in scraper_logs, one row per run however many batches it saved
+        """
+        values = dict(
+            start_time=start_time,
+            end_time=datetime.utcnow(),
+            status="success",
+            records_processed=totals["processed"],
+            records_added=totals["added"],
+            records_updated=totals["updated"]
+        )
+        if error is not None:
+            values.update(status="failed", errors={"message": str(error) or type(error).__name__})
+        elif totals["skipped_tiles"]:
+            values.update(status="partial", errors={"skipped_tiles": totals["skipped_tiles"]})
+        try:
+            await write_scraper_log(**values)
+        except Exception as e:
+            # Don't hide the run's own result or error behind a logging failure
+            logger.error(f"Error writing scraper log: {e}")
+
+
+async def _probe(client: httpx.AsyncClient, api_url: str, name: str, bbox: str) -> Optional[Dict[str, Any]]:
+    """
+    Request one test location from `api_url`, returning the decoded response on success
+    """
+    params = {**_BASE_PARAMS, "filter[search][bbox]": bbox, "page[size]": 10}
+    try:
+        response = await client.get(api_url, params=params)
+        logger.info(f"{name} status: {response.status_code}")
+        
+        if response.status_code == 200:
+            try:
+                data = orjson.loads(response.content)
+                camp_count = len(data.get('data', []))
+                logger.success(f"SUCCESS! Found {camp_count} campgrounds in {name} with {api_url}")
+                
+                if camp_count > 0:
+                    logger.info("First campground structure:")
+                    logger.info(orjson.dumps(data['data'][0], option=orjson.OPT_INDENT_2).decode()[:500])
+                
+                return data
+            except orjson.JSONDecodeError:
+                logger.error("Response is not JSON")
+                logger.error("Response: {}", response.content[:200].decode("utf-8", "replace"))
+        else:
+            logger.error(f"Failed with status {response.status_code}")
+            logger.error("Response: {}", response.content[:200].decode("utf-8", "replace"))
+            
+    except Exception as e:
+        logger.error(f"Exception with {api_url} for {name}: {e}")
+    return None
 
 
 async def test_api_request():
     """Test API request to see response format"""
     logger.info("Running API test request...")
     
-    # Test with a small area first
-    test_params = {
-        "filter[search][bbox]": "-122.5,37.0,-121.0,37.8",  # Bay Area
-        "filter[search][drive_time]": "any",
-        "filter[search][air_quality]": "any",
-        "filter[search][electric_amperage]": "any",
-        "filter[search][max_vehicle_length]": "any",
-        "filter[search][price]": "any",
-        "filter[search][rating]": "any",
-        "sort": "recommended",
-        "page[size]": 10,
-        "page[number]": 1
-    }
+    # Small test areas, only the bbox differs between them
+    test_locations = [
+        ("Bay Area", "-122.5,37.0,-121.0,37.8"),
+        ("Yellowstone", "-111.0885,44.1280,-110.0885,44.7280"),
+        ("Grand Canyon", "-112.3129,35.9069,-111.9129,36.3069"),
+    ]
     
     # Headers that should work
     headers = {
@@ -399,34 +856,25 @@ async def test_api_request():
         for api_url in api_versions:
             logger.info(f"Testing API: {api_url}")
             
-            try:
-                response = await client.get(api_url, params=test_params)
-                logger.info(f"Status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        camp_count = len(data.get('data', []))
-                        logger.success(f"SUCCESS! Found {camp_count} campgrounds with {api_url}")
-                        
-                        if camp_count > 0:
-                            logger.info("First campground structure:")
-                            logger.info(json.dumps(data['data'][0], indent=2)[:500])
-                        
-                        return data
-                    except json.JSONDecodeError:
-                        logger.error("Response is not JSON")
-                        logger.error(f"Response: {response.text[:200]}")
-                else:
-                    logger.error(f"Failed with status {response.status_code}")
-                    logger.error(f"Response: {response.text[:200]}")
-                    
-            except Exception as e:
-                logger.error(f"Exception with {api_url}: {e}")
+            # Locations are independent, probe them concurrently over the same client
+            results = await asyncio.gather(
+                *(_probe(client, api_url, name, bbox) for name, bbox in test_locations)
+            )
+            result = next((data for data in results if data is not None), None)
+            
+            if result is not None:
+                return result
     
     logger.error("All API endpoints failed")
     return None
 
 
 if __name__ == "__main__":
-    asyncio.run(test_api_request())
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on Windows
+        uvloop = None
+    
+    # Run on uvloop when available, like main.py
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(test_api_request())
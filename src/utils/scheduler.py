@@ -3,68 +3,71 @@
 Scheduler for running the scraper at regular intervals
 """
 import asyncio
-import threading
-from datetime import datetime, timedelta
-import time
+from datetime import datetime
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from src.config import SCHEDULE_INTERVAL, logger
 from src.scraper.dyrt_scraper import DyrtScraper
 
 
-def run_scraper():
+async def run_scraper(scraper: DyrtScraper):
     """
-    Run the scraper as a background task
+    Run the scraper as a scheduled job
     """
     logger.info(f"Scheduled scraper running at {datetime.now()}")
-    
-    # Create an event loop for the thread
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    # Run the scraper
-    scraper = DyrtScraper()
+
     try:
-        result = loop.run_until_complete(scraper.run())
+        result = await scraper.run()
         logger.success(f"Scheduled scraper completed: {result}")
     except Exception as e:
         logger.error(f"Error in scheduled scraper: {e}")
-    finally:
-        loop.close()
 
 
-def setup_scheduler():
+def setup_scheduler(scraper: DyrtScraper) -> AsyncIOScheduler:
     """
-    Setup the background scheduler to run the scraper at regular intervals
+    Setup the scheduler to run the scraper at regular intervals
+
+    Must be called from the running event loop. Every run reuses `scraper`,
+    so its connection pool, cookies and geocoding cache stay warm between runs.
     """
-    scheduler = BackgroundScheduler()
-    
+    scheduler = AsyncIOScheduler()
+
     # Add job to run every X hours (from config)
     scheduler.add_job(
         run_scraper,
         IntervalTrigger(hours=SCHEDULE_INTERVAL),
+        args=[scraper],
         id='scraper_job',
         name='Run scraper at regular intervals',
         replace_existing=True,
         next_run_time=datetime.now()  # Run immediately when starting
     )
-    
+
     # Start the scheduler
     scheduler.start()
     logger.info(f"Scheduler started. Will run every {SCHEDULE_INTERVAL} hours.")
-    
+
     return scheduler
 
 
+async def run_scheduler():
+    """
+    Run the scheduled scraper until cancelled
+    """
+    async with DyrtScraper() as scraper:
+        scheduler = setup_scheduler(scraper)
+        try:
+            # The jobs run on this loop, keep it alive
+            await asyncio.Event().wait()
+        finally:
+            scheduler.shutdown(wait=False)
+
+
 if __name__ == "__main__":
     # For testing the scheduler
-    scheduler = setup_scheduler()
-    
     try:
-        # Keep the main thread alive
-        while True:
-            time.sleep(60)
+        asyncio.run(run_scheduler())
     except (KeyboardInterrupt, SystemExit):
-        scheduler.shutdown()
\ No newline at end of file
+        pass